@@ -1,12 +1,289 @@
+import json
+
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
-from utils.data_loader import WeatherDataLoader
+from utils.data_loader import RealtimeWeather, WeatherDataLoader
 from utils.preprocessing import WeatherPreprocessor
 
 st.set_page_config(page_title="Weather Dashboard", page_icon="🌤️", layout="wide")
 
+
+# Cached fetch wrappers - memoize network calls for 30 minutes so Streamlit
+# reruns (widget toggles, page revisits) skip the HTTP round trip entirely.
+# The "🔄 Refresh Data" button clears st.cache_data for a forced refetch.
+@st.cache_data(ttl=1800)
+def _cached_realtime(city: str) -> RealtimeWeather:
+    return get_loader().get_realtime_weather(city)
+
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def _cached_history(city: str, days: int) -> pd.DataFrame:
+    return get_loader().fetch_historical_data(city, days)
+
+
+# The city registry is static, so memoize the sorted dropdown list and
+# per-city coordinate lookups across reruns.
+@st.cache_data(show_spinner=False)
+def _city_list() -> tuple:
+    return WeatherDataLoader.get_city_list()
+
+
+@st.cache_data(show_spinner=False)
+def _city_info(city: str) -> dict:
+    return WeatherDataLoader.get_city_info(city)
+
+
+# Maximum points sent to the browser per trace. 30-day data passes through
+# untouched; once the app graduates to multi-year history (see app.py),
+# traces are downsampled with LTTB so the charts stay interactive.
+MAX_TRACE_POINTS = 1500
+
+
+def _downsample_lttb(x, y, max_points: int = MAX_TRACE_POINTS):
+    """
+    Largest-Triangle-Three-Buckets downsampling for line traces.
+
+    Keeps the visually important points (local extremes) while capping the
+    number of points serialized to the browser. Returns (x, y) unchanged
+    when the series already fits within max_points.
+    """
+    import numpy as np
+
+    n = len(x)
+    if n <= max_points or max_points < 3:
+        return x, y
+
+    x_num = np.arange(n, dtype=np.float64)
+    y_arr = np.asarray(y, dtype=np.float64)
+
+    # First and last points are always kept
+    indices = [0]
+    bucket_size = (n - 2) / (max_points - 2)
+
+    # Anchor the first triangle at the first non-NaN point: a NaN anchor
+    # poisons every area in its bucket, and Meteostat windows routinely
+    # open with a NaN gap in tavg/tmin/tmax.
+    valid = np.flatnonzero(~np.isnan(y_arr))
+    if valid.size == 0:
+        # Nothing to triangulate against - fall back to uniform sampling
+        idx = np.linspace(0, n - 1, max_points).astype(np.intp)
+        return x[idx], y_arr[idx]
+
+    prev_idx = int(valid[0])
+    for i in range(max_points - 2):
+        # Current bucket boundaries
+        start = int(i * bucket_size) + 1
+        end = min(int((i + 1) * bucket_size) + 1, n - 1)
+
+        # Average point of the *next* bucket
+        next_start = end
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        avg_x = x_num[next_start:next_end].mean()
+        avg_y = np.nanmean(y_arr[next_start:next_end])
+
+        # Pick the point forming the largest triangle with prev + next avg
+        areas = np.abs(
+            (x_num[prev_idx] - avg_x) * (y_arr[start:end] - y_arr[prev_idx])
+            - (x_num[prev_idx] - x_num[start:end]) * (avg_y - y_arr[prev_idx])
+        )
+        # NaN candidates lose the argmax instead of raising from it, and a
+        # NaN pick keeps the previous anchor so it can't poison the next
+        # bucket's areas
+        pick = start + int(np.where(np.isnan(areas), -np.inf, areas).argmax())
+        indices.append(pick)
+        if not np.isnan(y_arr[pick]):
+            prev_idx = pick
+
+    indices.append(n - 1)
+    return x[indices], y_arr[indices]
+
+
+# Rolling mean + totals for the precipitation tab, computed in one pass and
+# memoized per (city, data window) so reruns without new data skip it.
+# The hash_funcs key avoids hashing the whole Series on every rerun.
+@st.cache_data(show_spinner=False,
+               hash_funcs={pd.Series: lambda s: (s.index[0], s.index[-1], len(s))})
+def _precip_stats(city: str, prcp: pd.Series):
+    import numpy as np
+
+    vals = prcp.to_numpy()
+    roll7 = prcp.rolling(7, min_periods=1).mean()
+    total = float(np.nansum(vals))
+    rainy_days = int(np.count_nonzero(vals > 0))
+    return roll7, total, rainy_days
+
+
+# Fingerprint used to cache figure JSON per data window without hashing
+# every cell of the DataFrame on each rerun.
+_DF_FINGERPRINT = {pd.DataFrame: lambda d: (d.index[0], d.index[-1], len(d), tuple(d.columns))}
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_FINGERPRINT)
+def _temp_fig_json(city: str, df: pd.DataFrame) -> str:
+    """Build the temperature figure and return it pre-serialized as JSON.
+
+    Caching the JSON string (rather than the Figure) skips Plotly's
+    figure-to-JSON encoder walk on every rerun for the same (city, window).
+    """
+    fig = go.Figure()
+
+    # One shared x array for all three traces - hands Plotly raw NumPy
+    # buffers instead of converting a pandas Series per trace
+    x = df.index.to_numpy()
+
+    if 'tavg' in df.columns:
+        x_avg, y_avg = _downsample_lttb(x, df['tavg'].to_numpy())
+        fig.add_trace(go.Scattergl(
+            x=x_avg,
+            y=y_avg,
+            name='Average',
+            line=dict(color='#FF6B6B', width=3),
+            mode='lines+markers'
+        ))
+
+    if 'tmax' in df.columns and 'tmin' in df.columns:
+        x_max, y_max = _downsample_lttb(x, df['tmax'].to_numpy())
+        fig.add_trace(go.Scattergl(
+            x=x_max,
+            y=y_max,
+            name='Max',
+            line=dict(color='#FFA500', width=2, dash='dot'),
+            mode='lines'
+        ))
+
+        x_min, y_min = _downsample_lttb(x, df['tmin'].to_numpy())
+        fig.add_trace(go.Scattergl(
+            x=x_min,
+            y=y_min,
+            name='Min',
+            line=dict(color='#4ECDC4', width=2, dash='dot'),
+            mode='lines'
+        ))
+
+    fig.update_layout(
+        title=f"Temperature Trends - {city}",
+        xaxis_title="Date",
+        yaxis_title="Temperature (°C)",
+        hovermode='x unified',
+        height=450,
+        template='plotly_dark',
+        showlegend=True
+    )
+    return fig.to_json()
+
+
+# Figure builders for the other tabs, cached on the same (city, window)
+# fingerprint so toggling unrelated widgets doesn't rebuild them.
+@st.cache_data(show_spinner=False, hash_funcs=_DF_FINGERPRINT)
+def _precip_fig(city: str, df: pd.DataFrame) -> go.Figure:
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=df.index.to_numpy(),
+        y=df['prcp'].to_numpy(),
+        name='Precipitation',
+        marker_color='#4A90E2'
+    ))
+    fig.update_layout(
+        title="Daily Precipitation",
+        xaxis_title="Date",
+        yaxis_title="Precipitation (mm)",
+        height=350,
+        template='plotly_dark'
+    )
+    return fig
+
+
+@st.cache_data(show_spinner=False,
+               hash_funcs={pd.Series: lambda s: (s.index[0], s.index[-1], len(s))})
+def _moisture_fig(city: str, prcp_roll7: pd.Series) -> go.Figure:
+    import plotly.express as px
+
+    fig = px.area(
+        x=prcp_roll7.index,
+        y=prcp_roll7,
+        labels={'x': 'Date', 'y': '7-Day Rolling Avg (mm)'},
+        template='plotly_dark'
+    )
+    fig.update_traces(line_color='#9B59B6', fillcolor='rgba(155, 89, 182, 0.3)')
+    fig.update_layout(height=350, title="Moisture Trend (7-day avg)")
+    return fig
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_FINGERPRINT)
+def _wind_fig(city: str, df: pd.DataFrame) -> go.Figure:
+    import plotly.express as px
+
+    fig = px.line(
+        x=df.index.to_numpy(),
+        y=df['wspd'].to_numpy(),
+        labels={'x': 'Date', 'y': 'Wind Speed (km/h)'},
+        template='plotly_dark',
+        title="Wind Speed Variation",
+        render_mode='webgl'
+    )
+    fig.update_traces(line_color='#2ECC71', line_width=2)
+    fig.update_layout(height=350)
+    return fig
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_FINGERPRINT)
+def _pressure_fig(city: str, df: pd.DataFrame) -> go.Figure:
+    import plotly.express as px
+
+    fig = px.line(
+        x=df.index.to_numpy(),
+        y=df['pres'].to_numpy(),
+        labels={'x': 'Date', 'y': 'Pressure (hPa)'},
+        template='plotly_dark',
+        title="Atmospheric Pressure",
+        render_mode='webgl'
+    )
+    fig.update_traces(line_color='#E74C3C', line_width=2)
+    fig.update_layout(height=350)
+    return fig
+
+
+# Static HTML templates hoisted to module scope - only the placeholder
+# substitution happens per rerun, not reconstruction of the full strings.
+_WEATHER_CARD_TMPL = """
+<div class="weather-card">
+    <h1 style="margin:0; font-size:72px;">{emoji}</h1>
+    <h2 style="margin:10px 0;">{city}</h2>
+    <p style="margin:5px 0; opacity:0.9;">{state}</p>
+    <h1 style="margin:15px 0; font-size:64px;">{temperature}°C</h1>
+    <p style="margin:5px 0; font-size:18px; opacity:0.95;">{description}</p>
+    <p style="margin:5px 0; opacity:0.8;">Feels like {feels_like}°C</p>
+</div>
+"""
+
+_NOW_CARD_TMPL = """
+<div style='background: linear-gradient(135deg, #FF6B6B 0%, #FF8E8E 100%);
+            padding: 20px; border-radius: 15px; text-align: center;'>
+    <h4 style='margin: 0; color: white; opacity: 0.9;'>🔴 NOW (Real-Time)</h4>
+    <h1 style='margin: 10px 0; color: white; font-size: 48px;'>{temp:.1f}°C</h1>
+    <p style='margin: 0; color: white; opacity: 0.8;'>Live API data</p>
+</div>
+"""
+
+_AVG_CARD_TMPL = """
+<div style='background: linear-gradient(135deg, #4ECDC4 0%, #6ED9D0 100%);
+            padding: 20px; border-radius: 15px; text-align: center;'>
+    <h4 style='margin: 0; color: white; opacity: 0.9;'>📊 30-DAY AVERAGE</h4>
+    <h1 style='margin: 10px 0; color: white; font-size: 48px;'>{temp:.1f}°C</h1>
+    <p style='margin: 0; color: white; opacity: 0.8;'>Historical mean</p>
+</div>
+"""
+
+_DIFF_CARD_TMPL = """
+<div style='background: linear-gradient(135deg, {color} 0%, rgba(255,255,255,0.2) 100%);
+            padding: 20px; border-radius: 15px; text-align: center; border: 2px solid {color};'>
+    <h4 style='margin: 0; opacity: 0.9;'>{arrow} DIFFERENCE</h4>
+    <h1 style='margin: 10px 0; font-size: 48px;'>{difference:+.1f}°C</h1>
+    <p style='margin: 0; opacity: 0.8; font-weight: bold;'>{comparison} than average</p>
+</div>
+"""
+
 # Custom CSS for better styling
 st.markdown("""
 <style>
@@ -67,15 +344,22 @@ st.title("🌤️ Live Weather Dashboard - India")
 st.markdown("### Real-time weather + 30-day historical analysis")
 st.markdown("---")
 
-# Initialize loader
-loader = WeatherDataLoader()
+# Initialize loader once per session - cache_resource returns the same
+# instance across reruns (no pickling), so its HTTP session and file-cache
+# setup aren't redone on every widget change.
+@st.cache_resource
+def get_loader() -> WeatherDataLoader:
+    return WeatherDataLoader()
+
+
+loader = get_loader()
 
 # Sidebar for city selection
 with st.sidebar:
     st.header("🌍 Select Location")
     
-    # Get list of all Indian cities
-    city_list = loader.get_city_list()
+    # Get list of all Indian cities (memoized)
+    city_list = _city_list()
     
     st.info(f"📍 **{len(city_list)} Indian Cities** available\n\n🌧️ Rain spots | ❄️ Snow destinations")
     
@@ -105,75 +389,94 @@ with st.sidebar:
     - ❄️ **Snow spots**: Gulmarg, Auli, Leh, Manali
     """)
 
+# Developer-only profiling: open the page with ?profile=1 to wrap the whole
+# render in pyinstrument and get a flame graph at the bottom. Keeps
+# optimization work aimed at the measured hot spot instead of guesses.
+_profiler = None
+if st.query_params.get('profile') == '1':
+    try:
+        from pyinstrument import Profiler
+
+        _profiler = Profiler()
+        _profiler.start()
+    except ImportError:
+        st.info("Profiling requested but pyinstrument is not installed "
+                "(`pip install pyinstrument`).")
+
 # Main content
 try:
-    # Fetch real-time weather
-    with st.spinner(f"Fetching live weather for {selected_city}..."):
-        realtime = loader.get_realtime_weather(selected_city)
-        city_info = WeatherDataLoader.get_city_info(selected_city)
+    # Fetch real-time and historical data concurrently (both memoized for
+    # 30 min). The two calls are independent network I/O, so the cold-path
+    # wall time drops from t_rt + t_hist to max(t_rt, t_hist).
+    from concurrent.futures import ThreadPoolExecutor
+
+    with st.spinner(f"Loading weather data for {selected_city}..."), \
+            ThreadPoolExecutor(max_workers=2) as ex:
+        f_rt = ex.submit(_cached_realtime, selected_city)
+        f_hist = ex.submit(_cached_history, selected_city, 30)
+        realtime = f_rt.result()
+        df = f_hist.result()
+    city_info = _city_info(selected_city)
     
     # Display real-time weather in a beautiful card
     st.markdown("## 🌡️ Current Weather (API)")
     
     # Debug: Show data source
-    if 'data_source' in realtime:
-        st.caption(f"📡 Source: {realtime['data_source']}")
+    st.caption(f"📡 Source: {realtime.data_source}")
     
     col1, col2, col3, col4, col5 = st.columns([2, 1.5, 1.5, 1.5, 1.5])
     
     with col1:
         # Main temperature display with icon
-        weather_emoji = WeatherDataLoader.get_weather_emoji(realtime['icon'])
-        st.markdown(f"""
-        <div class="weather-card">
-            <h1 style="margin:0; font-size:72px;">{weather_emoji}</h1>
-            <h2 style="margin:10px 0;">{selected_city}</h2>
-            <p style="margin:5px 0; opacity:0.9;">{city_info['state']}</p>
-            <h1 style="margin:15px 0; font-size:64px;">{realtime['temperature']}°C</h1>
-            <p style="margin:5px 0; font-size:18px; opacity:0.95;">{realtime['description']}</p>
-            <p style="margin:5px 0; opacity:0.8;">Feels like {realtime['feels_like']}°C</p>
-        </div>
-        """, unsafe_allow_html=True)
+        weather_emoji = WeatherDataLoader.get_weather_emoji(realtime.icon)
+        st.markdown(_WEATHER_CARD_TMPL.format(
+            emoji=weather_emoji,
+            city=selected_city,
+            state=city_info['state'],
+            temperature=realtime.temperature,
+            description=realtime.description,
+            feels_like=realtime.feels_like
+        ), unsafe_allow_html=True)
     
     with col2:
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        st.metric("💧 Humidity", f"{realtime['humidity']}%")
-        st.metric("🌫️ Visibility", f"{realtime['visibility']} km")
+        st.metric("💧 Humidity", f"{realtime.humidity}%")
+        st.metric("🌫️ Visibility", f"{realtime.visibility} km")
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col3:
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        st.metric("💨 Wind Speed", f"{realtime['wind_speed']} km/h")
-        st.metric("☁️ Cloud Cover", f"{realtime['clouds']}%")
+        st.metric("💨 Wind Speed", f"{realtime.wind_speed} km/h")
+        st.metric("☁️ Cloud Cover", f"{realtime.clouds}%")
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col4:
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        st.metric("🎚️ Pressure", f"{realtime['pressure']} hPa")
+        st.metric("🎚️ Pressure", f"{realtime.pressure} hPa")
         st.metric("📍 Lat/Lon", f"{city_info['lat']:.2f}°")
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col5:
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        st.metric("🕐 Updated", realtime['timestamp'].strftime('%H:%M'))
-        st.metric("📅 Date", realtime['timestamp'].strftime('%d %b'))
+        st.metric("🕐 Updated", realtime.timestamp.strftime('%H:%M'))
+        st.metric("📅 Date", realtime.timestamp.strftime('%d %b'))
         st.markdown('</div>', unsafe_allow_html=True)
     
     st.markdown("---")
     
-    # Fetch historical data (30 days)
+    # Historical data (30 days, fetched above alongside realtime)
     st.markdown("## 📊 Historical Data (Meteostat)")
-    with st.spinner("Loading 30-day historical data..."):
-        df = loader.fetch_historical_data(selected_city, days=30)
-    
+
     # Debug: Show Meteostat source
     meteostat_source = df.attrs.get('meteostat_source', 'Unknown source')
     st.caption(f"📡 Source: {meteostat_source}")
     
     st.success(f"✅ Loaded {len(df)} days of historical data")
     
-    # Calculate 30-day average for comparison
-    avg_temp_30days = df['tavg'].mean() if 'tavg' in df.columns else None
+    # Calculate all tavg summary stats in a single pass; reused by the
+    # comparison cards and the temperature tab metrics below.
+    tavg_stats = df['tavg'].agg(['mean', 'max', 'min']) if 'tavg' in df.columns else None
+    avg_temp_30days = tavg_stats['mean'] if tavg_stats is not None else None
     
     # Show comparison between real-time and average
     st.markdown("### 📊 Temperature Comparison: Now vs. 30-Day Average")
@@ -181,185 +484,140 @@ try:
     comp_col1, comp_col2, comp_col3 = st.columns(3)
     
     with comp_col1:
-        st.markdown("""
-        <div style='background: linear-gradient(135deg, #FF6B6B 0%, #FF8E8E 100%); 
-                    padding: 20px; border-radius: 15px; text-align: center;'>
-            <h4 style='margin: 0; color: white; opacity: 0.9;'>🔴 NOW (Real-Time)</h4>
-            <h1 style='margin: 10px 0; color: white; font-size: 48px;'>{:.1f}°C</h1>
-            <p style='margin: 0; color: white; opacity: 0.8;'>Live API data</p>
-        </div>
-        """.format(realtime['temperature']), unsafe_allow_html=True)
-    
+        st.markdown(_NOW_CARD_TMPL.format(temp=realtime.temperature),
+                    unsafe_allow_html=True)
+
     with comp_col2:
         if avg_temp_30days:
-            st.markdown("""
-            <div style='background: linear-gradient(135deg, #4ECDC4 0%, #6ED9D0 100%); 
-                        padding: 20px; border-radius: 15px; text-align: center;'>
-                <h4 style='margin: 0; color: white; opacity: 0.9;'>📊 30-DAY AVERAGE</h4>
-                <h1 style='margin: 10px 0; color: white; font-size: 48px;'>{:.1f}°C</h1>
-                <p style='margin: 0; color: white; opacity: 0.8;'>Historical mean</p>
-            </div>
-            """.format(avg_temp_30days), unsafe_allow_html=True)
-    
+            st.markdown(_AVG_CARD_TMPL.format(temp=avg_temp_30days),
+                        unsafe_allow_html=True)
+
     with comp_col3:
         if avg_temp_30days:
-            difference = realtime['temperature'] - avg_temp_30days
+            difference = realtime.temperature - avg_temp_30days
             is_hotter = difference > 0
-            color = '#FF6B6B' if is_hotter else '#4ECDC4'
-            arrow = '📈' if is_hotter else '📉'
-            comparison = 'HOTTER' if is_hotter else 'COOLER'
-            
-            st.markdown(f"""
-            <div style='background: linear-gradient(135deg, {color} 0%, rgba(255,255,255,0.2) 100%); 
-                        padding: 20px; border-radius: 15px; text-align: center; border: 2px solid {color};'>
-                <h4 style='margin: 0; opacity: 0.9;'>{arrow} DIFFERENCE</h4>
-                <h1 style='margin: 10px 0; font-size: 48px;'>{difference:+.1f}°C</h1>
-                <p style='margin: 0; opacity: 0.8; font-weight: bold;'>{comparison} than average</p>
-            </div>
-            """, unsafe_allow_html=True)
+
+            st.markdown(_DIFF_CARD_TMPL.format(
+                color='#FF6B6B' if is_hotter else '#4ECDC4',
+                arrow='📈' if is_hotter else '📉',
+                difference=difference,
+                comparison='HOTTER' if is_hotter else 'COOLER'
+            ), unsafe_allow_html=True)
     
     st.markdown("---")
 
     tab1, tab2, tab3 = st.tabs(["📈 Temperature Trends", "🌧️ Precipitation", "💨 Wind & Pressure"])
-    
-    with tab1:
+
+    # Each tab body is an @st.fragment - interactions inside a tab rerun
+    # only that fragment instead of the whole page, so toggling something
+    # in one tab no longer rebuilds the other tabs' figures and metrics.
+    @st.fragment
+    def _temperature_tab():
         st.markdown("### Temperature History (Last 30 Days)")
-        
-        fig = go.Figure()
-        
-        if 'tavg' in df.columns:
-            fig.add_trace(go.Scatter(
-                x=df.index, 
-                y=df['tavg'],
-                name='Average',
-                line=dict(color='#FF6B6B', width=3),
-                mode='lines+markers'
-            ))
-        
-        if 'tmax' in df.columns and 'tmin' in df.columns:
-            fig.add_trace(go.Scatter(
-                x=df.index,
-                y=df['tmax'],
-                name='Max',
-                line=dict(color='#FFA500', width=2, dash='dot'),
-                mode='lines'
-            ))
-            
-            fig.add_trace(go.Scatter(
-                x=df.index,
-                y=df['tmin'],
-                name='Min',
-                line=dict(color='#4ECDC4', width=2, dash='dot'),
-                mode='lines'
-            ))
-        
-        fig.update_layout(
-            title=f"Temperature Trends - {selected_city}",
-            xaxis_title="Date",
-            yaxis_title="Temperature (°C)",
-            hovermode='x unified',
-            height=450,
-            template='plotly_dark',
-            showlegend=True
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-        
+
+        # Bail out before building an empty figure when no temperature
+        # columns came back for this city/window
+        if 'tavg' not in df.columns and not {'tmin', 'tmax'} <= set(df.columns):
+            st.info("Temperature data unavailable for this location.")
+        else:
+            st.plotly_chart(json.loads(_temp_fig_json(selected_city, df)),
+                            use_container_width=True)
+
         # Quick stats
-        col1, col2, col3, col4 = st.columns(4)
-        if 'tavg' in df.columns:
-            with col1:
-                st.metric("📊 30-Day Average", f"{df['tavg'].mean():.1f}°C")
-            with col2:
-                st.metric("🔥 Highest", f"{df['tavg'].max():.1f}°C")
-            with col3:
-                st.metric("❄️ Lowest", f"{df['tavg'].min():.1f}°C")
-            with col4:
-                st.metric("📏 Range", f"{df['tavg'].max() - df['tavg'].min():.1f}°C")
-    
-    with tab2:
+        if tavg_stats is not None:
+            metrics = [
+                ("📊 30-Day Average", f"{tavg_stats['mean']:.1f}°C"),
+                ("🔥 Highest", f"{tavg_stats['max']:.1f}°C"),
+                ("❄️ Lowest", f"{tavg_stats['min']:.1f}°C"),
+                ("📏 Range", f"{tavg_stats['max'] - tavg_stats['min']:.1f}°C"),
+            ]
+            for col, (label, value) in zip(st.columns(4), metrics):
+                col.metric(label, value)
+
+    @st.fragment
+    def _precipitation_tab():
         st.markdown("### Precipitation & Humidity (Last 30 Days)")
-        
+
+        # Early guard: nothing below can render without the prcp column
+        if 'prcp' not in df.columns:
+            st.info("Precipitation data unavailable for this location.")
+            return
+
+        # Less-visited tab: lazy-load behind a toggle so the Plotly build +
+        # serialization only happens once the user asks for it. Flipping the
+        # toggle reruns just this fragment, not the whole page.
+        if not st.toggle("📊 Load precipitation charts", key="show_prcp"):
+            st.caption("Charts are built on demand to keep page loads fast.")
+            return
+
+        prcp_roll7, total_prcp, rainy_days = _precip_stats(selected_city, df['prcp'])
+
         col1, col2 = st.columns(2)
-        
+
         with col1:
-            if 'prcp' in df.columns:
-                fig_prcp = go.Figure()
-                fig_prcp.add_trace(go.Bar(
-                    x=df.index,
-                    y=df['prcp'],
-                    name='Precipitation',
-                    marker_color='#4A90E2'
-                ))
-                fig_prcp.update_layout(
-                    title="Daily Precipitation",
-                    xaxis_title="Date",
-                    yaxis_title="Precipitation (mm)",
-                    height=350,
-                    template='plotly_dark'
-                )
-                st.plotly_chart(fig_prcp, use_container_width=True)
-                
-                total_prcp = df['prcp'].sum()
-                rainy_days = (df['prcp'] > 0).sum()
-                st.metric("🌧️ Total Rainfall", f"{total_prcp:.1f} mm")
-                st.metric("📅 Rainy Days", f"{rainy_days} / {len(df)}")
-        
+            st.plotly_chart(_precip_fig(selected_city, df), use_container_width=True)
+
+            st.metric("🌧️ Total Rainfall", f"{total_prcp:.1f} mm")
+            st.metric("📅 Rainy Days", f"{rainy_days} / {len(df)}")
+
         with col2:
             # Create humidity trend if available (estimated from other metrics)
             st.markdown("#### 💧 Relative Humidity Indicator")
             st.info("Full humidity data requires premium API access. Showing precipitation as proxy.")
-            
-            if 'prcp' in df.columns:
-                # Simple visual indicator
-                fig_humidity = px.area(
-                    x=df.index,
-                    y=df['prcp'].rolling(7).mean(),
-                    labels={'x': 'Date', 'y': '7-Day Rolling Avg (mm)'},
-                    template='plotly_dark'
-                )
-                fig_humidity.update_traces(line_color='#9B59B6', fillcolor='rgba(155, 89, 182, 0.3)')
-                fig_humidity.update_layout(height=350, title="Moisture Trend (7-day avg)")
-                st.plotly_chart(fig_humidity, use_container_width=True)
-    
-    with tab3:
+
+            # Simple visual indicator
+            st.plotly_chart(_moisture_fig(selected_city, prcp_roll7),
+                            use_container_width=True)
+
+    @st.fragment
+    def _wind_pressure_tab():
+        import numpy as np
+
         st.markdown("### Wind & Atmospheric Pressure (Last 30 Days)")
-        
+
+        # Same lazy pattern as the precipitation tab - these two figures
+        # only get built when the user actually wants them
+        if not st.toggle("📊 Load wind & pressure charts", key="show_wind"):
+            st.caption("Charts are built on demand to keep page loads fast.")
+            return
+
         col1, col2 = st.columns(2)
-        
+
         with col1:
-            if 'wspd' in df.columns:
-                fig_wind = px.line(
-                    x=df.index,
-                    y=df['wspd'],
-                    labels={'x': 'Date', 'y': 'Wind Speed (km/h)'},
-                    template='plotly_dark',
-                    title="Wind Speed Variation"
-                )
-                fig_wind.update_traces(line_color='#2ECC71', line_width=2)
-                fig_wind.update_layout(height=350)
-                st.plotly_chart(fig_wind, use_container_width=True)
-                
-                st.metric("💨 Average Wind", f"{df['wspd'].mean():.1f} km/h")
-                st.metric("🌪️ Max Gust", f"{df['wspd'].max():.1f} km/h")
-        
+            if 'wspd' not in df.columns:
+                st.info("Wind data unavailable for this location.")
+            else:
+                st.plotly_chart(_wind_fig(selected_city, df), use_container_width=True)
+
+                # .to_numpy() + np.nan* reductions skip pandas' per-call
+                # Series scaffolding - measurable once history spans years
+                wspd_vals = df['wspd'].to_numpy()
+                st.metric("💨 Average Wind", f"{float(np.nanmean(wspd_vals)):.1f} km/h")
+                st.metric("🌪️ Max Gust", f"{float(np.nanmax(wspd_vals)):.1f} km/h")
+
         with col2:
-            if 'pres' in df.columns:
-                fig_pres = px.line(
-                    x=df.index,
-                    y=df['pres'],
-                    labels={'x': 'Date', 'y': 'Pressure (hPa)'},
-                    template='plotly_dark',
-                    title="Atmospheric Pressure"
-                )
-                fig_pres.update_traces(line_color='#E74C3C', line_width=2)
-                fig_pres.update_layout(height=350)
-                st.plotly_chart(fig_pres, use_container_width=True)
-                
-                st.metric("🎚️ Average Pressure", f"{df['pres'].mean():.1f} hPa")
-    
-    # Store data in session state for other pages
-    st.session_state['weather_data'] = df
+            if 'pres' not in df.columns:
+                st.info("Pressure data unavailable for this location.")
+            else:
+                st.plotly_chart(_pressure_fig(selected_city, df), use_container_width=True)
+
+                st.metric("🎚️ Average Pressure", f"{float(np.nanmean(df['pres'].to_numpy())):.1f} hPa")
+
+    with tab1:
+        _temperature_tab()
+    with tab2:
+        _precipitation_tab()
+    with tab3:
+        _wind_pressure_tab()
+    
+    # Store data in session state for other pages. Only reassign when the
+    # data actually changed - keeping the object identity stable lets
+    # downstream pages' caches keep hitting instead of seeing a "new" frame
+    # on every rerun.
+    weather_key = (selected_city, df.index[-1], len(df))
+    if st.session_state.get('_weather_key') != weather_key:
+        st.session_state['weather_data'] = df
+        st.session_state['_weather_key'] = weather_key
     st.session_state['selected_city'] = selected_city
     st.session_state['city_info'] = city_info
     st.session_state['realtime_weather'] = realtime
@@ -381,3 +639,11 @@ except Exception as e:
     - Ensure API key is set in `.env` file (optional - mock data will be used otherwise)
     - Try selecting a different city
     """)
+
+if _profiler is not None:
+    import streamlit.components.v1 as components
+
+    _profiler.stop()
+    st.markdown("---")
+    st.markdown("## 🔬 Profile (pyinstrument)")
+    components.html(_profiler.output_html(), height=800, scrolling=True)
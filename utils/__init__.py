@@ -2,7 +2,7 @@
 Utility modules for the Weather Forecasting Application
 """
 
-from .data_loader import WeatherDataLoader
+from .data_loader import RealtimeWeather, WeatherDataLoader
 from .preprocessing import WeatherPreprocessor
 
-__all__ = ['WeatherDataLoader', 'WeatherPreprocessor']
+__all__ = ['RealtimeWeather', 'WeatherDataLoader', 'WeatherPreprocessor']